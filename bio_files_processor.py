@@ -1,3 +1,29 @@
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def _atomic_output(output_path: str, **kwargs):
+    """
+    Opens a temporary file next to output_path for binary writing and moves it
+    onto output_path once the block exits, so the output may safely be the input.
+    """
+    directory = os.path.dirname(os.path.abspath(output_path))
+    output_file = tempfile.NamedTemporaryFile('wb', dir=directory, delete=False, **kwargs)
+    try:
+        with output_file:
+            yield output_file
+        # NamedTemporaryFile creates files as 0600; use the usual umask-based mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(output_file.name, 0o666 & ~umask)
+        os.replace(output_file.name, output_path)
+    except BaseException:
+        os.unlink(output_file.name)
+        raise
+
 def convert_multiline_fasta_to_oneline(input_fasta: str, output_fasta: str = None):
     """
     Converts a multi-line FASTA file into a one-line FASTA file.
@@ -12,23 +38,28 @@ def convert_multiline_fasta_to_oneline(input_fasta: str, output_fasta: str = Non
 
     """
 
-    with open(input_fasta, 'r') as input_file:
-        lines = input_file.readlines()
-
     if output_fasta is None:
         output_fasta = input_fasta.replace('.fasta', '_oneline.fasta')
 
-    with open(output_fasta, 'w') as output_file:
-        current_sequence = ''
-        for line in lines:
-            if line.startswith('>'):
-                if current_sequence:
-                    output_file.write(current_sequence + '\n')
-                current_sequence = f'{line}'
+    with _atomic_output(output_fasta, buffering=1 << 20) as output_file, \
+            open(input_fasta, 'rb', buffering=1 << 20) as input_file:
+        write = output_file.write
+        pending = False
+        for line in input_file:
+            if line[:1] == b'>':
+                if pending:
+                    write(b'\n')
+                if line.endswith(b'\r\n'):
+                    line = line[:-2] + b'\n'
+                write(line)
+                pending = True
             else:
-                current_sequence += line.strip()
-        if current_sequence:
-            output_file.write(current_sequence + '\n')
+                sequence = line.strip()
+                if sequence:
+                    write(sequence)
+                    pending = True
+        if pending:
+            write(b'\n')
 
 def change_fasta_start_pos(input_fasta: str, shift: int, output_fasta: str = None):
     """
@@ -51,12 +82,37 @@ def change_fasta_start_pos(input_fasta: str, shift: int, output_fasta: str = Non
     if output_fasta is None:
         output_fasta = input_fasta.replace('.fasta', '_.fasta')
 
-    with open(input_fasta, 'r') as f:
-        data = f.read().strip().split('\n')
-        header = data[0]
-        sequence = data[1]
+    # The mmap is closed before the temporary file replaces output_fasta,
+    # which may be the input file itself
+    with _atomic_output(output_fasta) as output_file:
+        with open(input_fasta, 'rb') as input_file, \
+                mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_start = 0
+            while header_start < len(mm) and mm[header_start:header_start + 1].isspace():
+                header_start += 1
+            file_end = len(mm)
+            while file_end > header_start and mm[file_end - 1:file_end].isspace():
+                file_end -= 1
+            header_end = mm.find(b'\n', header_start, file_end)
+            if header_end == -1:
+                raise ValueError("No sequence line found after the FASTA header")
+            seq_start = header_end + 1
+            seq_end = mm.find(b'\n', seq_start)
+            if seq_end == -1:
+                seq_end = len(mm)
+            while seq_end > seq_start and mm[seq_end - 1:seq_end].isspace():
+                seq_end -= 1
+            seq_length = seq_end - seq_start
 
-    shifted_sequence = sequence[shift:] + sequence[:shift]
+            if abs(shift) >= seq_length:
+                shift = 0
+            split = seq_start + shift % seq_length if seq_length else seq_start
 
-    with open(output_fasta, 'w') as f:
-        f.write(f"{header}\n{shifted_sequence}\n")
+            header = mm[header_start:header_end]
+            if header.endswith(b'\r'):
+                header = header[:-1]
+            with memoryview(mm) as view:
+                output_file.write(header + b'\n')
+                output_file.write(view[split:seq_end])
+                output_file.write(view[seq_start:split])
+                output_file.write(b'\n')
@@ -1,8 +1,24 @@
-from typing import List, Union
+from typing import List, Tuple, Union
 
 COMPLEMENT_DICT_DNA = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C', 'a': 't', 't': 'a', 'c': 'g', 'g': 'c'}
 COMPLEMENT_DICT_RNA = {'A': 'U', 'U': 'A', 'C': 'G', 'G': 'C', 'a': 'u', 'u': 'a', 'c': 'g', 'g': 'c'}
 ALPHABET = {'a', 't', 'u', 'g', 'c', 'A', 'T', 'U', 'G', 'C'}
+COMPLEMENT_TABLE_DNA = str.maketrans(COMPLEMENT_DICT_DNA)
+COMPLEMENT_TABLE_RNA = str.maketrans(COMPLEMENT_DICT_RNA)
+_DEFAULT_ALPHABET = ALPHABET
+DELETE_ALPHABET = str.maketrans('', '', ''.join(ALPHABET))
+
+def _has_t_and_u(seq: str) -> Tuple[bool, bool]:
+    """
+    Check whether a sequence contains thymine and/or uracil.
+    
+    Parameters:
+        seq (str): The DNA/RNA sequence to check.
+    
+    Returns:
+        Tuple[bool, bool]: Whether 'T'/'t' and 'U'/'u' occur in the sequence.
+    """
+    return 'T' in seq or 't' in seq, 'U' in seq or 'u' in seq
 
 def transcribe(seq: str) -> Union[str, List[str]]:
     """
@@ -30,8 +46,8 @@ def reverse(seq: str) -> str:
     Returns:
         str: The reversed DNA/RNA sequence.
     """
-    seq_u = seq.upper()
-    if 'T' in seq_u and 'U' in seq_u:
+    has_t, has_u = _has_t_and_u(seq)
+    if has_t and has_u:
         return "Invalid sequence. Contains both 'T' and 'U'."
     
     return seq[::-1]
@@ -46,14 +62,14 @@ def complement(seq: str) -> str:
     Returns:
         str: The complement DNA sequence.
     """
-    seq_u = seq.upper()
-    if 'T' in seq_u and 'U' in seq_u:
+    has_t, has_u = _has_t_and_u(seq)
+    if has_t and has_u:
         return "Invalid sequence. Contains both 'T' and 'U'."
     
-    if 'T' in seq or "t" in seq:
-        return ''.join(COMPLEMENT_DICT_DNA[base] for base in seq)
+    if has_t:
+        return seq.translate(COMPLEMENT_TABLE_DNA)
     else:
-        return ''.join(COMPLEMENT_DICT_RNA[base] for base in seq)
+        return seq.translate(COMPLEMENT_TABLE_RNA)
 
 def reverse_complement(seq: str) -> str:
     """
@@ -65,7 +81,21 @@ def reverse_complement(seq: str) -> str:
     Returns:
         str: The reverse complement DNA sequence.
     """
-    return reverse(complement(seq))
+    has_t, has_u = _has_t_and_u(seq)
+    if has_t and has_u:
+        return "Invalid sequence. Contains both 'T' and 'U'."
+
+    if has_t:
+        return seq.translate(COMPLEMENT_TABLE_DNA)[::-1]
+    else:
+        return seq.translate(COMPLEMENT_TABLE_RNA)[::-1]
+
+DNA_RNA_OPERATIONS = {
+    'transcribe': transcribe,
+    'reverse': reverse,
+    'complement': complement,
+    'reverse_complement': reverse_complement
+}
 
 def run_dna_rna_tools(*args: Union[str, List[str]], ALPHABET: set = ALPHABET) -> Union[str, List[str]]:
     """
@@ -91,20 +121,18 @@ def run_dna_rna_tools(*args: Union[str, List[str]], ALPHABET: set = ALPHABET) ->
         run_dna_rna_tools("ATGCTA", "TTAGCG", "transcribe")
         # Result: ["AUGCUA", "UUAGCG"]
     """
-    operations = {
-        'transcribe': transcribe,
-        'reverse': reverse,
-        'complement': complement,
-        'reverse_complement': reverse_complement
-    }
-    
     seqs, operation = args[:-1], args[-1]
     
-    if  not all(base in ALPHABET for seq in seqs for base in seq):
+    if ALPHABET is _DEFAULT_ALPHABET:
+        delete_valid = DELETE_ALPHABET
+    else:
+        delete_valid = str.maketrans('', '', ''.join(ALPHABET))
+    if not all(seq.translate(delete_valid) == '' for seq in seqs):
         return "Not DNA/RNA. Use only standard nucleotide sequences."
-    if not operation in operations:
+    function = DNA_RNA_OPERATIONS.get(operation)
+    if function is None:
         return "Invalid operation. Supported operations: transcribe, reverse, complement, reverse_complement."
-    results = [operations[operation](seq) for seq in seqs]
+    results = [function(seq) for seq in seqs]
     if len(results) == 1:
         return results[0]
     else:
@@ -1,6 +1,38 @@
 from typing import Dict, Tuple, Union
-from Bio import SeqIO
-from Bio.SeqUtils import GC
+
+# Maps each Sanger-encoded quality character to the character of its raw
+# PHRED score, the form in which filter_fastq returns qualities
+QUALITY_TO_PHRED = str.maketrans({chr(code): chr(code - 33) for code in range(33, 127)})
+# Deletes every valid Sanger quality character ('!' to '~')
+DELETE_QUALITY_CHARS = str.maketrans('', '', ''.join(chr(code) for code in range(33, 127)))
+# Deletes G, C and the S (G or C) ambiguity code in either case
+DELETE_GC = str.maketrans('', '', 'GCSgcs')
+
+def _parse_bounds(bounds: Union[float, int, Tuple[Union[float, int], Union[float, int]]],
+                  bound_types: Union[type, Tuple[type, ...]],
+                  error_message: str) -> Tuple[Union[float, int], Union[float, int]]:
+    """
+    Normalizes filtering bounds to a (lower, upper) tuple.
+
+    Parameters:
+    -----------
+    bounds (Union[float, int, Tuple[Union[float, int], Union[float, int]]]):
+        A single upper bound or a tuple of lower and upper bounds.
+    bound_types (Union[type, Tuple[type, ...]]):
+        Types accepted for a single upper bound.
+    error_message (str):
+        Message of the ValueError raised for malformed bounds.
+
+    Returns:
+    --------
+    Tuple[Union[float, int], Union[float, int]]:
+        The lower and upper bounds.
+    """
+    if isinstance(bounds, bound_types):
+        return 0, bounds
+    if isinstance(bounds, tuple) and len(bounds) == 2:
+        return bounds
+    raise ValueError(error_message)
 
 def filter_fastq(file_path: str,
                  gc_bounds: Union[float, Tuple[Union[float, int], Union[float, int]]] = (0, 100),
@@ -35,37 +67,45 @@ def filter_fastq(file_path: str,
         A filtered dictionary where each value is a tuple containing two strings,
         representing DNA sequences and their quality.
     """
+    # Biopython is slow to import, so load it only when filtering is requested
+    from Bio.SeqIO.QualityIO import FastqGeneralIterator
+
+    length_lower, length_upper = _parse_bounds(
+        length_bounds, int, "length_bounds should be a single integer or a tuple of two integers.")
+    gc_lower, gc_upper = _parse_bounds(
+        gc_bounds, (float, int), "gc_bounds should be a single float/int or a tuple of two floats/ints.")
+    # GC-content always lies in [0, 100] and PHRED scores are non-negative,
+    # so bounds that accept every read need not be computed at all.
+    check_gc = gc_lower > 0 or gc_upper < 100
+    check_quality = quality_threshold > 0
+
     filtered_seqs = {}
 
     with open(file_path, "r") as handle:
-        for record in SeqIO.parse(handle, "fastq"):
-            gc_content = GC(record.seq)
-
-            if isinstance(gc_bounds, (float, int)):
-                lower_bound = 0
-                upper_bound = gc_bounds
-            elif isinstance(gc_bounds, tuple) and len(gc_bounds) == 2:
-                lower_bound, upper_bound = gc_bounds
-            else:
-                raise ValueError("gc_bounds should be a single float/int or a tuple of two floats/ints.")
-
-            if lower_bound <= gc_content <= upper_bound:
-                seq_length = len(record.seq)
-
-                if isinstance(length_bounds, int):
-                    lower_bound = 0
-                    upper_bound = length_bounds
-                elif isinstance(length_bounds, tuple) and len(length_bounds) == 2:
-                    lower_bound, upper_bound = length_bounds
-                else:
-                    raise ValueError("length_bounds should be a single integer or a tuple of two integers.")
-
-                if lower_bound <= seq_length <= upper_bound:
-                    quality_values = [chr(qual) for qual in record.letter_annotations["phred_quality"]]
-                    quality_count = sum(record.letter_annotations["phred_quality"])
-                    seq_quality = quality_count / seq_length
-
-                    if seq_quality >= quality_threshold:
-                        filtered_seqs[record.id] = (str(record.seq), "".join(quality_values))
+        for title, seq, quality in FastqGeneralIterator(handle):
+            if quality.translate(DELETE_QUALITY_CHARS):
+                raise ValueError("Invalid character in quality string")
+            seq_length = len(seq)
+
+            if not length_lower <= seq_length <= length_upper:
+                continue
+
+            # Divide exactly as Bio.SeqUtils.GC and the mean quality did, so
+            # reads sitting on a float bound are kept; an empty read is
+            # divided by 1 so it is still treated as 0% GC and 0 average quality.
+            scale = seq_length or 1
+
+            if check_gc:
+                gc_count = seq_length - len(seq.translate(DELETE_GC))
+                if not gc_lower <= gc_count * 100 / scale <= gc_upper:
+                    continue
+
+            if check_quality:
+                phred_sum = sum(quality.encode("ascii")) - 33 * seq_length
+                if phred_sum / scale < quality_threshold:
+                    continue
+
+            record_id = title.split(None, 1)[0]
+            filtered_seqs[record_id] = (seq, quality.translate(QUALITY_TO_PHRED))
 
     return filtered_seqs
@@ -29,6 +29,15 @@ NONPOLAR_AA = {'A', 'G', 'V', 'L', 'I', 'P', 'F', 'M', 'W'}
 POSITIVE_CHARGE = {'R', 'K', 'H'}
 NEGATIVE_CHARGE = {'D', 'E'}
 
+# Translation table that deletes every valid one-letter code
+DELETE_AMINO_ACIDS_ONE_LETTER = str.maketrans('', '', ''.join(AMINO_ACIDS_ONE_LETTER))
+
+# Translation tables that delete one class of amino acids; the class size
+# is the length difference after translation, counted in a single C pass
+DELETE_POLAR_AA = str.maketrans('', '', ''.join(POLAR_AA))
+DELETE_POSITIVE_CHARGE = str.maketrans('', '', ''.join(POSITIVE_CHARGE))
+DELETE_NEGATIVE_CHARGE = str.maketrans('', '', ''.join(NEGATIVE_CHARGE))
+
 DNA_AA = {
     'F': 'TTY', 'L': '(TTR or CTN)', 'I': 'ATH', 'M': 'ATG', 'V': 'GTN',
     'S': '(TCN or AGY)', 'P': 'CCN', 'T': 'ACN', 'A': 'GCN', 'Y': 'TAY',
@@ -43,6 +52,10 @@ RNA_AA = {
     'G': 'GGN', 'W': 'UGG'
 }
 
+# Translation tables expanding each amino acid into its codon pattern
+DNA_AA_TABLE = str.maketrans(DNA_AA)
+RNA_AA_TABLE = str.maketrans(RNA_AA)
+
 
 def to_rna(seq: str) -> str:
     """
@@ -58,7 +71,10 @@ def to_rna(seq: str) -> str:
     str
         RNA sequence.
     """
-    result = ''.join(RNA_AA[base] for base in seq)
+    invalid_amino_acids = seq.translate(DELETE_AMINO_ACIDS_ONE_LETTER)
+    if invalid_amino_acids:
+        raise KeyError(invalid_amino_acids[0])
+    result = seq.translate(RNA_AA_TABLE)
     return result
 
 
@@ -80,17 +96,9 @@ def define_charge(seq: str) -> Dict[str, int]:
         - 'Negative' for amino acids with negative charge.
         - 'Neutral' for neutral amino acids.
     """
-    positive_count = 0
-    negative_count = 0
-    neutral_count = 0
-
-    for aa in seq:
-        if aa in POSITIVE_CHARGE:
-            positive_count += 1
-        elif aa in NEGATIVE_CHARGE:
-            negative_count += 1
-        else:
-            neutral_count += 1
+    positive_count = len(seq) - len(seq.translate(DELETE_POSITIVE_CHARGE))
+    negative_count = len(seq) - len(seq.translate(DELETE_NEGATIVE_CHARGE))
+    neutral_count = len(seq) - positive_count - negative_count
 
     result = {
         'Positive': positive_count,
@@ -115,12 +123,8 @@ def define_polarity(seq: str) -> Dict[str, int]:
         Dictionary with keys 'Polar', 'Nonpolar' and values of quantity of
         according groups in sequence.
     """
-    polarity_count = {'Polar': 0, 'Nonpolar': 0}
-    for aminoacid in seq:
-        if aminoacid in POLAR_AA:
-            polarity_count['Polar'] += 1
-        else:
-            polarity_count['Nonpolar'] += 1
+    polar_count = len(seq) - len(seq.translate(DELETE_POLAR_AA))
+    polarity_count = {'Polar': polar_count, 'Nonpolar': len(seq) - polar_count}
     return polarity_count
 
 
@@ -138,10 +142,11 @@ def to_dna(seq: str) -> str:
     str
         According DNA sequence.
     """
-    sequence_dna = []
-    for aminoacid in seq:
-        sequence_dna.append(DNA_AA[aminoacid])
-    return ''.join(sequence_dna)
+    invalid_amino_acids = seq.translate(DELETE_AMINO_ACIDS_ONE_LETTER)
+    if invalid_amino_acids:
+        raise KeyError(invalid_amino_acids[0])
+    sequence_dna = seq.translate(DNA_AA_TABLE)
+    return sequence_dna
 
 
 def change_abbreviation(seq: str) -> str:
@@ -177,12 +182,19 @@ def is_correct_seq(seq: str) -> bool:
         True - if there are no extraneous characters, False - if there are
         extraneous characters.
     """
-    unique_amino_acids = set(seq)
+    if not seq.translate(DELETE_AMINO_ACIDS_ONE_LETTER):
+        return True
     unique_amino_acids_three = set(seq.split("-"))
-    check = unique_amino_acids <= AMINO_ACIDS_ONE_LETTER or unique_amino_acids_three <= AMINO_ACIDS_THREE_LETTER
+    check = unique_amino_acids_three <= AMINO_ACIDS_THREE_LETTER
     return check
 
 
+PROTEIN_OPERATIONS = {
+    'one letter': change_abbreviation, 'RNA': to_rna, 'DNA': to_dna,
+    'charge': define_charge, 'polarity': define_polarity
+}
+
+
 def protein_tool(*args: str) -> Union[str, List[Union[Dict[str, int], str]]]:
     """
     Receives a request from the user and runs the desired function.
@@ -201,15 +213,12 @@ def protein_tool(*args: str) -> Union[str, List[Union[Dict[str, int], str]]]:
         If several sequences are supplied, outputs the result as a list.
     """
     *seqs, operation = args
-    operations = {
-        'one letter': change_abbreviation, 'RNA': to_rna, 'DNA': to_dna,
-        'charge': define_charge, 'polarity': define_polarity
-    }
+    function = PROTEIN_OPERATIONS[operation]
     output = []
     for seq in seqs:
         answer = is_correct_seq(seq.upper())
         if answer:
-            function_output = operations[operation](seq.upper())
+            function_output = function(seq.upper())
             output.append(function_output)
         else:
             print(f'Something wrong with {seq}', file=sys.stderr)